@@ -4,18 +4,38 @@ Cross-platform build script for Python applications.
 Supports Windows, Linux, and macOS with platform-specific configurations.
 """
 
+import functools
 import os
 import sys
-import shutil
-import subprocess
 import logging
 import glob
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
 import argparse
-import json
 import re
+import string
 import platform
 
+# Prefer orjson for config parsing when available; fall back to stdlib json.
+# Both helpers work on bytes so the two parsers are interchangeable.
+try:
+    import orjson
+
+    def _loads(data):
+        return orjson.loads(data)
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    import json
+
+    def _loads(data):
+        return json.loads(data)
+
+    def _dumps(obj):
+        return json.dumps(obj, indent=4).encode()
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -23,119 +43,141 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Platform identity is fixed for the life of the process, so resolve it once
+# at import time instead of re-branching on sys.platform per call.
+_PLAT = {'win32': 'windows', 'darwin': 'macos'}.get(sys.platform, 'linux')
+_EXE_EXT = '.exe' if sys.platform == 'win32' else ''
+_ICON_EXT = {'windows': '.ico', 'macos': '.icns'}.get(_PLAT, '.png')
+
+# Default configuration shapes, built once at import; _default_config only
+# merges the base dict with the entry for the current platform.
+_BASE_DEFAULT = {
+    "app_name": "YourApp",
+    "version": "1.0.0",
+    "main_script": "main.py",
+    "build_dir": "build",
+    "dist_dir": "dist",
+    "additional_data": [],
+    "hidden_imports": [],
+    "exclude_modules": [],
+    "icon_file": f"icons/app_icon{_ICON_EXT}"
+}
+_PLATFORM_DEFAULTS = {
+    "windows": {
+        "console": False,
+        "admin_access": False,
+        "uac_admin": False,
+        "version_file": "version.txt"
+    },
+    "macos": {
+        "bundle_identifier": "com.example.yourapp",
+        "entitlements_file": "entitlements.plist",
+        "info_plist": "Info.plist"
+    },
+    "linux": {
+        "console": False,
+        "desktop_file": "app.desktop",
+        "categories": "Utility;"
+    }
+}
+
+# Parsed-config cache keyed by (abspath, st_mtime_ns, st_size) so repeated
+# loads of the same unchanged file skip the read+parse entirely.
+_CONFIG_CACHE = {}
+
+def purge_cache(path=None):
+    """Drop cached config entries, either for one path or all of them."""
+    if path is None:
+        _CONFIG_CACHE.clear()
+    else:
+        abspath = os.path.abspath(path)
+        for key in [k for k in _CONFIG_CACHE if k[0] == abspath]:
+            del _CONFIG_CACHE[key]
+
+async def _run_async(cmd):
+    """Run a subprocess without blocking the event loop, raising on failure."""
+    import asyncio
+    import subprocess
+
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    stdout, stderr = await proc.communicate()
+    if stdout:
+        sys.stdout.write(stdout.decode(errors='replace'))
+    if stderr:
+        sys.stderr.write(stderr.decode(errors='replace'))
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
+
 class PlatformConfig:
     """Platform-specific configurations and utilities."""
     
     @staticmethod
     def get_platform():
         """Get current platform identifier."""
-        if sys.platform == 'win32':
-            return 'windows'
-        elif sys.platform == 'darwin':
-            return 'macos'
-        else:
-            return 'linux'
-    
+        return _PLAT
+
     @staticmethod
     def get_executable_extension():
         """Get platform-specific executable extension."""
-        return '.exe' if sys.platform == 'win32' else ''
-    
+        return _EXE_EXT
+
     @staticmethod
     def get_icon_extension():
         """Get platform-specific icon extension."""
-        if sys.platform == 'win32':
-            return '.ico'
-        elif sys.platform == 'darwin':
-            return '.icns'
-        else:
-            return '.png'
+        return _ICON_EXT
 
 class BuildConfig:
     """Handles build configuration and settings."""
     
     def __init__(self, config_file='build_config.json'):
         self.config_file = config_file
-        self.platform = PlatformConfig.get_platform()
+        self.platform = _PLAT
         self.config = self._load_config()
     
     def _load_config(self):
         """Load configuration from JSON file."""
-        if os.path.exists(self.config_file):
-            with open(self.config_file, 'r') as f:
-                config = json.load(f)
-                # Merge platform-specific config with base config
-                platform_config = config.get(self.platform, {})
-                base_config = config.get('base', {})
-                return {**base_config, **platform_config}
-        return self._default_config()
+        try:
+            stat = os.stat(self.config_file)
+        except OSError:
+            return self._default_config()
+
+        cache_key = (os.path.abspath(self.config_file), stat.st_mtime_ns, stat.st_size)
+        cached = _CONFIG_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
+        config = _loads(Path(self.config_file).read_bytes())
+        # Merge platform-specific config with base config
+        platform_config = config.get(self.platform, {})
+        base_config = config.get('base', {})
+        merged = {**base_config, **platform_config}
+
+        _CONFIG_CACHE[cache_key] = merged
+        return merged
     
     def _default_config(self):
         """Return default configuration."""
-        base_config = {
-            "app_name": "YourApp",
-            "version": "1.0.0",
-            "main_script": "main.py",
-            "build_dir": "build",
-            "dist_dir": "dist",
-            "additional_data": [],
-            "hidden_imports": [],
-            "exclude_modules": [],
-            "icon_file": f"icons/app_icon{PlatformConfig.get_icon_extension()}"
-        }
-        
-        # Platform-specific defaults
-        platform_configs = {
-            "windows": {
-                "console": False,
-                "admin_access": False,
-                "uac_admin": False,
-                "version_file": "version.txt"
-            },
-            "macos": {
-                "bundle_identifier": "com.example.yourapp",
-                "entitlements_file": "entitlements.plist",
-                "info_plist": "Info.plist"
-            },
-            "linux": {
-                "console": False,
-                "desktop_file": "app.desktop",
-                "categories": "Utility;"
-            }
-        }
-        
-        return {**base_config, **platform_configs.get(self.platform, {})}
+        return {**_BASE_DEFAULT, **_PLATFORM_DEFAULTS.get(self.platform, {})}
     
     def save(self):
         """Save current configuration to file."""
-        with open(self.config_file, 'w') as f:
-            json.dump(self.config, f, indent=4)
+        Path(self.config_file).write_bytes(_dumps(self.config))
 
-class WindowsBuilder:
-    """Windows-specific build operations."""
-    
-    @staticmethod
-    def create_version_info(config):
-        """Create version info file for Windows."""
-        # Parse version string into tuple
-        version_parts = config['version'].split('.')
-        while len(version_parts) < 4:
-            version_parts.append('0')
-        version_tuple = ','.join(version_parts)
-        
-        # Get company info
-        company = config.get('company', {})
-        company_name = company.get('name', 'Unknown Company')
-        copyright_info = company.get('copyright', f'Copyright (c) {company_name}')
-        description = company.get('description', config['app_name'])
-        product_name = company.get('product_name', config['app_name'])
-        trademark = company.get('trademark', company_name)
-        
-        version_info = f'''
+# Zero-padding for short version strings; concat+slice keeps the
+# four-component normalization branchless.
+_VERSION_PAD = ('0', '0', '0', '0')
+
+# Windows version-info template, parsed once at import so each build only
+# pays for the substitution, not for re-formatting the whole block.
+_VERSION_TEMPLATE = string.Template('''
 VSVersionInfo(
   ffi=FixedFileInfo(
-    filevers=({version_tuple}),
-    prodvers=({version_tuple}),
+    filevers=($version_tuple),
+    prodvers=($version_tuple),
     mask=0x3f,
     flags=0x0,
     OS=0x40004,
@@ -147,25 +189,62 @@ VSVersionInfo(
     StringFileInfo([
       StringTable(
         u'040904B0',
-        [StringStruct(u'CompanyName', u'{company_name}'),
-         StringStruct(u'FileDescription', u'{description}'),
-         StringStruct(u'FileVersion', u'{config["version"]}'),
-         StringStruct(u'InternalName', u'{config["app_name"]}'),
-         StringStruct(u'LegalCopyright', u'{copyright_info}'),
-         StringStruct(u'LegalTrademarks', u'{trademark}'),
-         StringStruct(u'OriginalFilename', u'{config["app_name"]}.exe'),
-         StringStruct(u'ProductName', u'{product_name}'),
-         StringStruct(u'ProductVersion', u'{config["version"]}')]
+        [StringStruct(u'CompanyName', u'$company_name'),
+         StringStruct(u'FileDescription', u'$description'),
+         StringStruct(u'FileVersion', u'$version'),
+         StringStruct(u'InternalName', u'$app_name'),
+         StringStruct(u'LegalCopyright', u'$copyright_info'),
+         StringStruct(u'LegalTrademarks', u'$trademark'),
+         StringStruct(u'OriginalFilename', u'$app_name.exe'),
+         StringStruct(u'ProductName', u'$product_name'),
+         StringStruct(u'ProductVersion', u'$version')]
       )
     ]),
     VarFileInfo([VarStruct(u'Translation', [1033, 1200])])
   ]
 )
-'''
-        with open('version_info.txt', 'w') as f:
-            f.write(version_info)
+''')
+
+class WindowsBuilder:
+    """Windows-specific build operations."""
+
+    @staticmethod
+    def create_version_info(config):
+        """Create version info file for Windows."""
+        version = config['version']
+        app_name = config['app_name']
+
+        # Pad the version to four components in one concat+slice
+        version_tuple = ','.join((*version.split('.'), *_VERSION_PAD)[:4])
+
+        # Get company info
+        company = config.get('company', {})
+        company_name = company.get('name', 'Unknown Company')
+
+        version_info = _VERSION_TEMPLATE.substitute(
+            version=version,
+            app_name=app_name,
+            version_tuple=version_tuple,
+            company_name=company_name,
+            copyright_info=company.get('copyright', f'Copyright (c) {company_name}'),
+            description=company.get('description', app_name),
+            product_name=company.get('product_name', app_name),
+            trademark=company.get('trademark', company_name)
+        )
+        Path('version_info.txt').write_text(version_info)
         return 'version_info.txt'
 
+    @classmethod
+    def build_extra(cls, config):
+        """Return extra PyInstaller args and the post-build step for Windows."""
+        extra_args = []
+        if not config.get('console', False):
+            extra_args.append('--windowed')
+        extra_args.extend(['--version-file', cls.create_version_info(config)])
+        if config.get('uac_admin'):
+            extra_args.append('--uac-admin')
+        return extra_args, None
+
 class LinuxBuilder:
     """Linux-specific build operations."""
     
@@ -180,57 +259,77 @@ Type=Application
 Categories={config.get('categories', 'Utility;')}
 Version={config['version']}
 """
-        desktop_file = os.path.join(config['build_dir'], f"{config['app_name']}.desktop")
-        os.makedirs(os.path.dirname(desktop_file), exist_ok=True)
-        with open(desktop_file, 'w') as f:
-            f.write(desktop_content)
-        return desktop_file
+        desktop_file = Path(config['build_dir']) / f"{config['app_name']}.desktop"
+        desktop_file.parent.mkdir(parents=True, exist_ok=True)
+        desktop_file.write_text(desktop_content)
+        return str(desktop_file)
+
+    @classmethod
+    def build_extra(cls, config):
+        """Return extra PyInstaller args and the post-build step for Linux."""
+        cls.create_desktop_file(config)
+        return [], None
+
+# Signing identities in order of preference, and a single precompiled scan
+# that pulls (hash, identity type) pairs out of `security` output in one pass.
+_PRIORITY = (
+    'Developer ID Application',
+    'Apple Development',
+    '3rd Party Mac Developer Application',
+    'Mac Developer'
+)
+_IDENTITY_RE = re.compile(
+    r'([A-F0-9]{40}).*?(Developer ID Application|Apple Development|'
+    r'3rd Party Mac Developer Application|Mac Developer)'
+)
+
+@functools.lru_cache(maxsize=1)
+def _find_identity():
+    """Query the keychain for the best signing identity (cached per session)."""
+    import subprocess
+
+    try:
+        result = subprocess.run(
+            ['security', 'find-identity', '-v', '-p', 'codesigning'],
+            capture_output=True, text=True, check=True
+        )
+
+        # Seed the dict in priority order so insertion order *is* the
+        # preference ranking and one pass picks the winner.
+        identities = dict.fromkeys(_PRIORITY)
+        for match in _IDENTITY_RE.finditer(result.stdout):
+            if identities[match.group(2)] is None:
+                identities[match.group(2)] = match.group(1)
+
+        choice = next((item for item in identities.items() if item[1]), None)
+        if choice is not None:
+            logger.info(f"Using signing identity: {choice[0]}")
+            return choice[1]
+
+        logger.warning("No preferred signing identity found. Using ad-hoc signing.")
+        return '-'
+
+    except subprocess.CalledProcessError as e:
+        logger.error(f"Error checking signing identities: {e}")
+        return '-'
 
 class MacOSBuilder:
     """macOS-specific build operations."""
-    
+
     @staticmethod
     def get_signing_identity():
         """Get the best available signing identity."""
-        try:
-            result = subprocess.run(
-                ['security', 'find-identity', '-v', '-p', 'codesigning'],
-                capture_output=True, text=True, check=True
-            )
-            
-            identities = {
-                'Developer ID Application': None,
-                'Apple Development': None,
-                '3rd Party Mac Developer Application': None,
-                'Mac Developer': None
-            }
-            
-            for line in result.stdout.splitlines():
-                for identity in identities.keys():
-                    if identity in line:
-                        match = re.search(r'([A-F0-9]{40})', line)
-                        if match:
-                            identities[identity] = match.group(1)
-                            break
-            
-            for identity, hash_value in identities.items():
-                if hash_value:
-                    logger.info(f"Using signing identity: {identity}")
-                    return hash_value
-            
-            logger.warning("No preferred signing identity found. Using ad-hoc signing.")
-            return '-'
-            
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Error checking signing identities: {e}")
-            return '-'
+        return _find_identity()
     
     @staticmethod
-    def sign_app(app_path, config):
+    async def sign_app(app_path, config):
         """Sign the macOS application bundle."""
+        import asyncio
+        import subprocess
+
         try:
             signing_identity = MacOSBuilder.get_signing_identity()
-            
+
             cmd = [
                 'codesign',
                 '--force',
@@ -241,113 +340,135 @@ class MacOSBuilder:
                 '-s', signing_identity,
                 app_path
             ]
-            
-            subprocess.run(cmd, check=True)
+
+            await _run_async(cmd)
             logger.info("Application signed successfully!")
-            
-            # Verify the signature
-            subprocess.run(['codesign', '--verify', '--deep', '--strict', app_path], check=True)
-            
+
+            # Kick off the verify so it can overlap any remaining post-build work
+            verify_task = asyncio.create_task(
+                _run_async(['codesign', '--verify', '--deep', '--strict', app_path])
+            )
+            await verify_task
+
             return True
-            
+
         except subprocess.CalledProcessError as e:
             logger.error(f"Error during code signing: {e}")
             return False
 
+    @classmethod
+    def build_extra(cls, config):
+        """Return extra PyInstaller args and the post-build step for macOS."""
+        extra_args = []
+        if not config.get('console', False):
+            extra_args.append('--windowed')
+        if 'bundle_identifier' in config:
+            extra_args.extend(['--osx-bundle-identifier', config['bundle_identifier']])
+
+        async def sign(cfg):
+            app_path = os.path.join(cfg['dist_dir'], f"{cfg['app_name']}.app")
+            await cls.sign_app(app_path, cfg)
+
+        return extra_args, sign
+
+# Let tests reset the memoized keychain lookup through the public name
+MacOSBuilder.get_signing_identity.cache_clear = _find_identity.cache_clear
+
+# Platform builders resolved once; the running platform never changes.
+_PLATFORM_BUILDERS = {
+    'windows': WindowsBuilder,
+    'linux': LinuxBuilder,
+    'macos': MacOSBuilder
+}
+
 class AppBuilder:
     """Cross-platform application builder."""
     
     def __init__(self, config):
         self.config = config
-        self.platform = PlatformConfig.get_platform()
-        self.platform_builders = {
-            'windows': WindowsBuilder,
-            'linux': LinuxBuilder,
-            'macos': MacOSBuilder
-        }
     
+    @staticmethod
+    def _remove_dir(directory):
+        """Remove a directory tree, returning True if anything was removed.
+
+        An empty directory is dropped with a single rmdir instead of the
+        full rmtree walk, and a missing one costs only the failed scandir.
+        """
+        try:
+            with os.scandir(directory) as entries:
+                empty = next(entries, None) is None
+        except FileNotFoundError:
+            return False
+        if empty:
+            os.rmdir(directory)
+        else:
+            import shutil
+            shutil.rmtree(directory, ignore_errors=True)
+        return True
+
     def clean(self):
         """Clean build and dist directories and .spec files."""
-        # Clean directories
-        for directory in [self.config.config['build_dir'], self.config.config['dist_dir']]:
-            if os.path.exists(directory):
-                shutil.rmtree(directory)
+        # Remove both directory trees in parallel; the work is syscall-bound.
+        dirs = [self.config.config['build_dir'], self.config.config['dist_dir']]
+        with ThreadPoolExecutor(max_workers=len(dirs)) as executor:
+            removed = list(executor.map(self._remove_dir, dirs))
+        for directory, was_removed in zip(dirs, removed):
+            if was_removed:
                 logger.info(f"Cleaned {directory} directory")
-        
+
         # Clean .spec files
         for spec_file in glob.glob("*.spec"):
             os.remove(spec_file)
             logger.info(f"Removed {spec_file}")
     
-    def prepare_platform_specific(self):
-        """Prepare platform-specific build requirements."""
-        builder = self.platform_builders.get(self.platform)
-        if not builder:
-            return []
-            
-        extra_args = []
-        
-        if self.platform == 'windows':
-            version_file = builder.create_version_info(self.config.config)
-            extra_args.extend(['--version-file', version_file])
-            if self.config.config.get('uac_admin'):
-                extra_args.append('--uac-admin')
-            
-        elif self.platform == 'linux':
-            builder.create_desktop_file(self.config.config)
-            
-        return extra_args
-    
     def build(self):
+        """Build the application (synchronous wrapper around build_async)."""
+        import asyncio
+        return asyncio.run(self.build_async())
+
+    async def build_async(self):
         """Build the application."""
+        import subprocess
+
         try:
-            # Prepare PyInstaller command
-            cmd = [
-                'pyinstaller',
-                '--name', self.config.config['app_name'],
-                '--noconfirm',
-                '--clean'
-            ]
-            
-            # Add platform-specific options
-            if self.platform == 'windows' or self.platform == 'macos':
-                if not self.config.config.get('console', False):
-                    cmd.append('--windowed')
-            
+            config = self.config.config
+
+            # Resolve platform specifics once: extra argv fragments plus an
+            # optional post-build step
+            extra_args, post_build = _PLATFORM_BUILDERS[_PLAT].build_extra(config)
+
+            # Collect the PyInstaller argv as option fragments, flattened
+            # into the final list in a single chain pass.
+            parts = [('pyinstaller', '--name', config['app_name'], '--noconfirm', '--clean')]
+
             # Add icon if specified
-            if 'icon_file' in self.config.config:
-                cmd.extend(['--icon', self.config.config['icon_file']])
-            
+            if 'icon_file' in config:
+                parts.append(('--icon', config['icon_file']))
+
             # Add platform-specific arguments
-            cmd.extend(self.prepare_platform_specific())
-            
-            # Add macOS bundle identifier
-            if self.platform == 'macos' and 'bundle_identifier' in self.config.config:
-                cmd.extend(['--osx-bundle-identifier', self.config.config['bundle_identifier']])
-            
+            parts.append(tuple(extra_args))
+
             # Add hidden imports
-            for imp in self.config.config['hidden_imports']:
-                cmd.extend(['--hidden-import', imp])
-            
+            for imp in config['hidden_imports']:
+                parts.append(('--hidden-import', imp))
+
             # Add data files
-            for src, dst in self.config.config['additional_data']:
-                cmd.extend(['--add-data', f'{src}{os.pathsep}{dst}'])
-            
+            for src, dst in config['additional_data']:
+                parts.append(('--add-data', f'{src}{os.pathsep}{dst}'))
+
             # Add main script
-            cmd.append(self.config.config['main_script'])
-            
+            parts.append((config['main_script'],))
+
+            cmd = list(chain.from_iterable(parts))
+
             # Run PyInstaller
-            subprocess.run(cmd, check=True)
+            await _run_async(cmd)
             logger.info("Application built successfully!")
-            
+
             # Handle platform-specific post-build steps
-            if self.platform == 'macos':
-                app_path = os.path.join(
-                    self.config.config['dist_dir'],
-                    f"{self.config.config['app_name']}.app"
-                )
-                MacOSBuilder.sign_app(app_path, self.config.config)
-            
+            if post_build is not None:
+                await post_build(config)
+
             return True
             
         except subprocess.CalledProcessError as e:
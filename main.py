@@ -6,14 +6,14 @@ This is a dummy application to test the build system.
 
 import sys
 import platform
-import json
 from datetime import datetime
+
+from build import BuildConfig
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QFrame, QGroupBox
 )
 from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QFont
 
 
 class TestApp(QMainWindow):
@@ -25,82 +25,74 @@ class TestApp(QMainWindow):
         
     def setup_window(self):
         """Configure the main window."""
-        # Load config to get app name
-        config_file = 'build_config.json'
+        # Load config to get app name (shares the cached loader in build.py)
         try:
-            with open(config_file, 'r') as f:
-                config = json.load(f)
-                app_name = config['base']['app_name']
-                company = config['base']['company']['name']
-        except:
+            config = BuildConfig('build_config.json').config
+            app_name = config['app_name']
+            company = config['company']['name']
+        except (OSError, ValueError, KeyError):
             app_name = "Test App"
             company = "Test Company"
         
         self.setWindowTitle(f"{app_name} by {company}")
-        self.setGeometry(100, 100, 600, 400)
-        
-        # Center the window
-        screen = QApplication.primaryScreen().geometry()
-        x = (screen.width() - self.width()) // 2
-        y = (screen.height() - self.height()) // 2
-        self.move(x, y)
-        
+        w, h = 600, 400
+        self.setGeometry(100, 100, w, h)
+
+        # Center the window on the usable screen area; the size is already
+        # known locally, so skip the width()/height() round-trips into Qt.
+        screen = QApplication.primaryScreen().availableGeometry()
+        self.move((screen.width() - w) // 2, (screen.height() - h) // 2)
+        
+    @staticmethod
+    def _add_info_row(layout, name, value):
+        """Add a name/value row to an info layout."""
+        row = QHBoxLayout()
+        row.addWidget(QLabel(name))
+        row.addWidget(QLabel(value))
+        row.addStretch()
+        layout.addLayout(row)
+
     def create_widgets(self):
         """Create the GUI elements."""
+        # QFont is only needed while building the title widget
+        from PyQt6.QtGui import QFont
+
+        # Hoist the frequently-instantiated Qt names into locals so the
+        # widget construction below runs on LOAD_FAST lookups.
+        label = QLabel
+        vbox = QVBoxLayout
+        center = Qt.AlignmentFlag.AlignCenter
+        bold = QFont.Weight.Bold
+
         # Create central widget and main layout
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
-        main_layout = QVBoxLayout(central_widget)
+        main_layout = vbox(central_widget)
         main_layout.setSpacing(20)
         main_layout.setContentsMargins(20, 20, 20, 20)
-        
+
         # Title
-        title = QLabel("Cross-Platform Test Application")
-        title.setFont(QFont('Arial', 16, QFont.Weight.Bold))
-        title.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        title = label("Cross-Platform Test Application")
+        title.setFont(QFont('Arial', 16, bold))
+        title.setAlignment(center)
         main_layout.addWidget(title)
-        
+
         # System Information Group
         info_group = QGroupBox("System Information")
-        info_layout = QVBoxLayout()
-        
-        # Platform info
-        platform_layout = QHBoxLayout()
-        platform_label = QLabel("Platform:")
-        platform_value = QLabel(platform.platform())
-        platform_layout.addWidget(platform_label)
-        platform_layout.addWidget(platform_value)
-        platform_layout.addStretch()
-        info_layout.addLayout(platform_layout)
-        
-        # Python Version
-        python_layout = QHBoxLayout()
-        python_label = QLabel("Python Version:")
-        python_value = QLabel(sys.version.split()[0])
-        python_layout.addWidget(python_label)
-        python_layout.addWidget(python_value)
-        python_layout.addStretch()
-        info_layout.addLayout(python_layout)
-        
-        # Architecture
-        arch_layout = QHBoxLayout()
-        arch_label = QLabel("Architecture:")
-        arch_value = QLabel(platform.architecture()[0])
-        arch_layout.addWidget(arch_label)
-        arch_layout.addWidget(arch_value)
-        arch_layout.addStretch()
-        info_layout.addLayout(arch_layout)
-        
+        info_layout = vbox()
+        self._add_info_row(info_layout, "Platform:", platform.platform())
+        self._add_info_row(info_layout, "Python Version:", sys.version.split()[0])
+        self._add_info_row(info_layout, "Architecture:", platform.architecture()[0])
         info_group.setLayout(info_layout)
         main_layout.addWidget(info_group)
         
         # Interactive Test Group
         interact_group = QGroupBox("Interactive Test")
-        interact_layout = QVBoxLayout()
-        
+        interact_layout = vbox()
+
         # Counter
         counter_layout = QHBoxLayout()
-        self.counter_label = QLabel("Counter: 0")
+        self.counter_label = label("Counter: 0")
         counter_button = QPushButton("Increment")
         counter_button.clicked.connect(self.increment_counter)
         counter_layout.addWidget(self.counter_label)
@@ -109,14 +101,20 @@ class TestApp(QMainWindow):
         interact_layout.addLayout(counter_layout)
         
         # Time display
-        self.time_label = QLabel()
-        self.update_time()
-        interact_layout.addWidget(self.time_label)
-        
-        # Create timer for updating time
+        self.time_label = label()
+        # Bind the hot update_time callees once so the timer callback
+        # avoids re-resolving the attribute chains every second.
+        self._set_time_text = self.time_label.setText
+        self._now = datetime.now
+        self._last_time = None
+
+        # Single-shot timer re-armed on each fire, aligned to the next
+        # wall-clock second so we wake up once per visible change.
         self.timer = QTimer()
+        self.timer.setSingleShot(True)
         self.timer.timeout.connect(self.update_time)
-        self.timer.start(1000)  # Update every second
+        self.update_time()
+        interact_layout.addWidget(self.time_label)
         
         interact_group.setLayout(interact_layout)
         main_layout.addWidget(interact_group)
@@ -124,7 +122,7 @@ class TestApp(QMainWindow):
         # Status bar
         status_bar = QFrame()
         status_layout = QHBoxLayout(status_bar)
-        status_label = QLabel("✓ Application running normally")
+        status_label = label("✓ Application running normally")
         status_label.setStyleSheet("color: green")
         status_layout.addWidget(status_label)
         status_layout.addStretch()
@@ -139,9 +137,13 @@ class TestApp(QMainWindow):
         self.counter_label.setText(f"Counter: {self.counter}")
     
     def update_time(self):
-        """Update the time display."""
-        current_time = datetime.now().strftime("%H:%M:%S")
-        self.time_label.setText(f"Current Time: {current_time}")
+        """Update the time display and re-arm the timer on the second boundary."""
+        now = self._now()
+        current_time = now.strftime("%H:%M:%S")
+        if current_time != self._last_time:
+            self._last_time = current_time
+            self._set_time_text(f"Current Time: {current_time}")
+        self.timer.start(1000 - now.microsecond // 1000)
 
 
 def main():